@@ -6,20 +6,38 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from homeassistant.config_entries import ConfigEntry
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import DeviceInfo
 
-from .api import CommaAPIClient
-from .const import CONF_JWT_TOKEN, DOMAIN, PLATFORMS
+from .api import CommaAPIClient, CommaAthenaClient
+from .const import CONF_JWT_TOKEN, CONF_LOCATION_FILTER, DOMAIN, PLATFORMS
 from .coordinator import CommaDataUpdateCoordinator
+from .profiler import RefreshProfiler
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import HomeAssistant, ServiceCall
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+    }
+)
+
 
 @dataclass
 class CommaData:
@@ -27,11 +45,47 @@ class CommaData:
 
     coordinator: CommaDataUpdateCoordinator
     api_client: CommaAPIClient
+    athena_client: CommaAthenaClient
+    profiler: RefreshProfiler | None = None
 
 
 type CommaConfigEntry = ConfigEntry[CommaData]
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the comma.ai services."""
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next refresh cycles of every loaded entry."""
+        entries: list[CommaConfigEntry] = [
+            entry
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        ]
+        if not entries:
+            raise ServiceValidationError("No comma.ai entries are loaded")
+        if any(
+            entry.runtime_data.profiler and entry.runtime_data.profiler.active
+            for entry in entries
+        ):
+            raise ServiceValidationError("A profile capture is already running")
+
+        # One capture covers every entry so they share the profiler and tracing
+        profiler = RefreshProfiler(
+            hass,
+            [entry.runtime_data.coordinator for entry in entries],
+            call.data[ATTR_CYCLES],
+        )
+        for entry in entries:
+            entry.runtime_data.profiler = profiler
+        profiler.start()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA
+    )
+    return True
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: CommaConfigEntry,
@@ -52,20 +106,40 @@ async def async_setup_entry(
         _LOGGER.error("Failed to authenticate with comma.ai: %s", err)
         return False
 
-    coordinator = CommaDataUpdateCoordinator(hass, config_entry, api_client)
+    athena_client = CommaAthenaClient(
+        jwt_token=config_entry.data[CONF_JWT_TOKEN],
+        session=async_get_clientsession(hass),
+    )
+
+    coordinator = CommaDataUpdateCoordinator(
+        hass, config_entry, api_client, athena_client
+    )
     await coordinator.async_config_entry_first_refresh()
 
     config_entry.runtime_data = CommaData(
         coordinator=coordinator,
         api_client=api_client,
+        athena_client=athena_client,
     )
 
+    config_entry.async_on_unload(config_entry.add_update_listener(async_reload_entry))
+
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: CommaConfigEntry) -> None:
+    """Reload comma.ai config entry when its options change."""
+    # Data updates (e.g. a reconfigured token) already reload the entry
+    coordinator = entry.runtime_data.coordinator
+    if entry.options.get(CONF_LOCATION_FILTER, False) != coordinator.location_filter_enabled:
+        await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: CommaConfigEntry) -> bool:
     """Unload comma.ai config entry."""
+    if entry.runtime_data.profiler:
+        entry.runtime_data.profiler.remove(entry.runtime_data.coordinator)
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         del entry.runtime_data
     return unload_ok
@@ -3,8 +3,19 @@
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from aiohttp import ClientError, ClientTimeout
+
+from .const import (
+    ATHENA_BASE_URL,
+    ATHENA_CALL_TIMEOUT,
+    ATHENA_ONLINE_THRESHOLD,
+    ATHENA_RELAY_TIMEOUT,
+)
+
 if TYPE_CHECKING:
     from aiohttp import ClientSession
 
@@ -67,3 +78,178 @@ class CommaAPIClient:
         return await self._request("GET", f"/v1.1/devices/{dongle_id}/stats")
 
 
+@dataclass(frozen=True)
+class AthenaCall:
+    """A single Athena JSON-RPC call and how long its result may be cached.
+
+    A ttl of 0 means the result is never cached.
+    """
+
+    key: str
+    method: str
+    params: dict[str, Any] = field(default_factory=dict)
+    ttl: float = 0
+
+
+class CommaAthenaClient:
+    """comma.ai Athena JSON-RPC client.
+
+    Athena relays JSON-RPC requests to online devices. Calls for one device are
+    sent as a single batch. Results of slow-changing calls are cached per call
+    for their TTL, live readings are fetched on every poll.
+    """
+
+    def __init__(
+        self,
+        jwt_token: str,
+        session: ClientSession,
+        base_url: str = ATHENA_BASE_URL,
+    ) -> None:
+        """Initialize the Athena client."""
+        self.jwt_token = jwt_token
+        self.session = session
+        self.base_url = base_url
+        self._cache: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._next_id = 0
+
+    @staticmethod
+    def is_online(last_athena_ping: int | None, now: float | None = None) -> bool:
+        """Return whether a device pinged Athena recently enough to be reachable."""
+        if last_athena_ping is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now - last_athena_ping <= ATHENA_ONLINE_THRESHOLD
+
+    async def _request(
+        self,
+        dongle_id: str,
+        payload: list[dict[str, Any]],
+        timeout: float,
+    ) -> list[dict[str, Any]]:
+        """Send a JSON-RPC batch to a device through Athena."""
+        url = f"{self.base_url}/{dongle_id}"
+        headers = {
+            "Authorization": f"JWT {self.jwt_token}",
+            "Content-Type": "application/json",
+        }
+
+        try:
+            response = await self.session.post(
+                url,
+                headers=headers,
+                json=payload,
+                timeout=ClientTimeout(total=timeout),
+            )
+
+            if response.status == 401:
+                raise CommaAPIError("Invalid JWT token")
+            elif response.status == 403:
+                raise CommaAPIError("Access forbidden")
+            elif response.status == 404:
+                raise CommaAPIError("Device not connected")
+            elif response.status >= 400:
+                raise CommaAPIError(f"Athena error: {response.status}")
+
+            result = await response.json()
+        except (ClientError, TimeoutError, ValueError) as err:
+            raise CommaAPIError(f"Athena request failed: {err}") from err
+
+        # A lone error object is returned when the batch itself was rejected
+        if isinstance(result, dict):
+            raise CommaAPIError(f"Athena error: {result.get('error', result)}")
+        if not isinstance(result, list):
+            raise CommaAPIError(f"Unexpected Athena response: {result!r}")
+        return result
+
+    async def call_batch(
+        self,
+        dongle_id: str,
+        calls: tuple[AthenaCall, ...],
+    ) -> dict[str, Any]:
+        """Run calls against a device in one round-trip, keyed by call key.
+
+        Cached results are returned without contacting the device. Calls that
+        fail individually map to None and are not cached.
+        """
+        now = time.monotonic()
+        results: dict[str, Any] = {}
+        pending: dict[int, AthenaCall] = {}
+
+        for call in calls:
+            cached = self._cache.get((dongle_id, call.key))
+            if cached is not None and cached[0] > now:
+                results[call.key] = cached[1]
+                continue
+            self._next_id += 1
+            pending[self._next_id] = call
+
+        if not pending:
+            return results
+
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": call.method, "params": call.params}
+            for request_id, call in pending.items()
+        ]
+        # The device runs a batch one call after another, so allow every call
+        # its full timeout plus the relay overhead
+        batch_timeout = sum(
+            call.params.get("timeout", ATHENA_CALL_TIMEOUT) for call in pending.values()
+        )
+        responses = await self._request(
+            dongle_id, payload, timeout=batch_timeout / 1000 + ATHENA_RELAY_TIMEOUT
+        )
+
+        for response in responses:
+            # Ignore elements that are not JSON-RPC responses to our calls
+            if not isinstance(response, dict) or not isinstance(response.get("id"), int):
+                continue
+            call = pending.pop(response["id"], None)
+            if call is None:
+                continue
+            if "error" in response:
+                _LOGGER.debug(
+                    "Athena call %s failed for device %s: %s",
+                    call.method,
+                    dongle_id,
+                    response["error"],
+                )
+                results[call.key] = None
+                continue
+            results[call.key] = response.get("result")
+            if call.ttl > 0:
+                self._cache[(dongle_id, call.key)] = (now + call.ttl, results[call.key])
+
+        for call in pending.values():
+            results[call.key] = None
+
+        return results
+
+    async def get_telemetry(
+        self,
+        dongle_id: str,
+        last_athena_ping: int | None,
+    ) -> dict[str, Any] | None:
+        """Get live telemetry for a device, or None if the device is offline."""
+        if not self.is_online(last_athena_ping):
+            return None
+        return await self.call_batch(dongle_id, ATHENA_TELEMETRY_CALLS)
+
+
+ATHENA_TELEMETRY_CALLS: tuple[AthenaCall, ...] = (
+    AthenaCall(
+        key="device_state",
+        method="getMessage",
+        params={"service": "deviceState", "timeout": ATHENA_CALL_TIMEOUT},
+    ),
+    AthenaCall(
+        key="peripheral_state",
+        method="getMessage",
+        params={"service": "peripheralState", "timeout": ATHENA_CALL_TIMEOUT},
+    ),
+    AthenaCall(
+        key="network_metered",
+        method="getNetworkMetered",
+        ttl=300,
+    ),
+)
@@ -6,11 +6,12 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import CommaAPIClient, CommaAPIError
-from .const import CONF_JWT_TOKEN, DOMAIN
+from .const import CONF_JWT_TOKEN, CONF_LOCATION_FILTER, DOMAIN
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigFlowResult
@@ -29,6 +30,12 @@ class CommaConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> CommaOptionsFlow:
+        """Get the options flow for this handler."""
+        return CommaOptionsFlow()
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         super().__init__()
@@ -109,3 +116,23 @@ class CommaConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
 
+class CommaOptionsFlow(OptionsFlow):
+    """Handle options for comma.ai."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_LOCATION_FILTER,
+                    default=self.config_entry.options.get(CONF_LOCATION_FILTER, False),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
+
@@ -10,10 +10,22 @@ DOMAIN: Final = "comma_ai"
 PLATFORMS = [Platform.SENSOR, Platform.DEVICE_TRACKER]
 
 CONF_JWT_TOKEN: Final = "jwt_token"
+CONF_LOCATION_FILTER: Final = "location_filter"
 
 API_BASE_URL: Final = "https://api.commadotai.com"
 
 # Update interval in seconds
 UPDATE_INTERVAL: Final = 60
 
+ATHENA_BASE_URL: Final = "https://athena.comma.ai"
+
+# Devices that have not pinged Athena within this many seconds are treated as offline
+ATHENA_ONLINE_THRESHOLD: Final = 180
+
+# Per-call timeout for Athena getMessage calls in milliseconds
+ATHENA_CALL_TIMEOUT: Final = 1500
+
+# Time allowed on top of the per-call timeouts for Athena to relay a batch, in seconds
+ATHENA_RELAY_TIMEOUT: Final = 5
+
 
@@ -5,12 +5,13 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, TypedDict
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import CommaAPIError
-from .const import DOMAIN, UPDATE_INTERVAL
+from .api import CommaAPIError, CommaAthenaClient
+from .const import CONF_LOCATION_FILTER, DOMAIN, UPDATE_INTERVAL
+from .location_filter import LocationFilter
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -21,6 +22,16 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+class CommaTelemetry(TypedDict):
+    """Type for live device telemetry fetched over Athena."""
+
+    car_battery_voltage: float | None
+    thermal_status: str | None
+    network_type: str | None
+    network_metered: bool | None
+    onroad: bool | None
+
+
 class CommaDevice(TypedDict):
     """Type for comma device data."""
 
@@ -33,9 +44,23 @@ class CommaDevice(TypedDict):
     location_lat: float | None
     location_lng: float | None
     location_time: int | None
+    location_accuracy: int
     last_athena_ping: int | None
     openpilot_version: str | None
     stats: dict[str, Any] | None
+    telemetry: CommaTelemetry | None
+
+
+class CommaFleetStats(TypedDict):
+    """Type for account-wide aggregate data."""
+
+    total_distance: float
+    total_minutes: int
+    total_routes: int
+    devices_online: int
+    most_recent_dongle_id: str | None
+    most_recent_device: str | None
+    most_recent_ping: int | None
 
 
 class CommaCoordinatorData(TypedDict):
@@ -43,6 +68,151 @@ class CommaCoordinatorData(TypedDict):
 
     profile: dict[str, Any]
     devices: dict[str, CommaDevice]
+    fleet: CommaFleetStats
+
+
+class _FleetContribution(NamedTuple):
+    """What a single device adds to the fleet totals."""
+
+    distance: float
+    minutes: int
+    routes: int
+    online: bool
+    last_ping: int | None
+
+
+def _fleet_contribution(
+    device: CommaDevice, previous: _FleetContribution | None
+) -> _FleetContribution:
+    """Build the fleet contribution of a device.
+
+    When stats could not be fetched this refresh, the previous distance,
+    minutes and routes are kept so a failed request does not look like a
+    meter reset.
+    """
+    online = CommaAthenaClient.is_online(device["last_athena_ping"])
+    if device["stats"] is None and previous is not None:
+        return previous._replace(online=online, last_ping=device["last_athena_ping"])
+
+    all_stats = device["stats"]["all"] if device["stats"] else {}
+    return _FleetContribution(
+        distance=all_stats.get("distance") or 0.0,
+        minutes=all_stats.get("minutes") or 0,
+        routes=all_stats.get("routes") or 0,
+        online=online,
+        last_ping=device["last_athena_ping"],
+    )
+
+
+def _message(result: Any, service: str) -> dict[str, Any]:
+    """Return the service payload of an Athena getMessage result, or {}."""
+    if not isinstance(result, dict) or not isinstance(result.get(service), dict):
+        return {}
+    return result[service]
+
+
+def _typed(value: Any, expected: type | tuple[type, ...]) -> Any:
+    """Return value if it has the expected type (bools never count as numbers)."""
+    if isinstance(value, bool) and bool not in (
+        expected if isinstance(expected, tuple) else (expected,)
+    ):
+        return None
+    return value if isinstance(value, expected) else None
+
+
+def _parse_telemetry(results: dict[str, Any]) -> CommaTelemetry:
+    """Build telemetry from Athena results, ignoring malformed values."""
+    device_state = _message(results.get("device_state"), "deviceState")
+    peripheral_state = _message(results.get("peripheral_state"), "peripheralState")
+    # peripheralState reports the car battery voltage in millivolts
+    voltage = _typed(peripheral_state.get("voltage"), (int, float))
+
+    return CommaTelemetry(
+        car_battery_voltage=voltage / 1000 if voltage is not None else None,
+        thermal_status=_typed(device_state.get("thermalStatus"), str),
+        network_type=_typed(device_state.get("networkType"), str),
+        network_metered=_typed(results.get("network_metered"), bool),
+        onroad=_typed(device_state.get("started"), bool),
+    )
+
+
+class FleetAggregator:
+    """Maintain account-wide totals by applying per-device deltas.
+
+    Only devices whose contribution changed since the previous refresh touch
+    the totals. Removing a device from the account lowers the totals. The
+    most recently active device is only searched for again when the current
+    one goes backwards or disappears.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the aggregator."""
+        self._contributions: dict[str, _FleetContribution] = {}
+        self._distance = 0.0
+        self._minutes = 0
+        self._routes = 0
+        self._online = 0
+        self._most_recent: str | None = None
+
+    def _apply_delta(
+        self, old: _FleetContribution | None, new: _FleetContribution | None
+    ) -> None:
+        """Replace a device's old contribution with its new one."""
+        if old is not None:
+            self._distance -= old.distance
+            self._minutes -= old.minutes
+            self._routes -= old.routes
+            self._online -= old.online
+        if new is not None:
+            self._distance += new.distance
+            self._minutes += new.minutes
+            self._routes += new.routes
+            self._online += new.online
+
+    def _last_ping(self, dongle_id: str | None) -> int:
+        """Return the last ping of a tracked device, 0 if unknown."""
+        if dongle_id is None or dongle_id not in self._contributions:
+            return 0
+        return self._contributions[dongle_id].last_ping or 0
+
+    def update(self, devices: dict[str, CommaDevice]) -> CommaFleetStats:
+        """Apply the changes in devices and return the new fleet stats."""
+        rescan = False
+
+        for dongle_id in self._contributions.keys() - devices.keys():
+            self._apply_delta(self._contributions.pop(dongle_id), None)
+            rescan = rescan or dongle_id == self._most_recent
+
+        for dongle_id, device in devices.items():
+            old = self._contributions.get(dongle_id)
+            new = _fleet_contribution(device, old)
+            if new == old:
+                continue
+            self._apply_delta(old, new)
+            self._contributions[dongle_id] = new
+
+            if dongle_id == self._most_recent:
+                rescan = rescan or (new.last_ping or 0) < (old.last_ping or 0)
+            elif (new.last_ping or 0) > self._last_ping(self._most_recent):
+                self._most_recent = dongle_id
+
+        if rescan:
+            self._most_recent = max(
+                self._contributions,
+                key=lambda dongle_id: self._contributions[dongle_id].last_ping or 0,
+                default=None,
+            )
+
+        most_recent = devices.get(self._most_recent) if self._most_recent else None
+        return CommaFleetStats(
+            total_distance=round(self._distance, 6),
+            total_minutes=self._minutes,
+            total_routes=self._routes,
+            devices_online=self._online,
+            most_recent_dongle_id=self._most_recent,
+            most_recent_device=most_recent["alias"] if most_recent else None,
+            most_recent_ping=most_recent["last_athena_ping"] if most_recent else None,
+        )
 
 
 class CommaDataUpdateCoordinator(DataUpdateCoordinator[CommaCoordinatorData]):
@@ -51,7 +221,11 @@ class CommaDataUpdateCoordinator(DataUpdateCoordinator[CommaCoordinatorData]):
     config_entry: CommaConfigEntry
 
     def __init__(
-        self, hass: HomeAssistant, config_entry: CommaConfigEntry, api_client: CommaAPIClient
+        self,
+        hass: HomeAssistant,
+        config_entry: CommaConfigEntry,
+        api_client: CommaAPIClient,
+        athena_client: CommaAthenaClient,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -62,6 +236,12 @@ class CommaDataUpdateCoordinator(DataUpdateCoordinator[CommaCoordinatorData]):
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
         )
         self.api_client = api_client
+        self.athena_client = athena_client
+        self.fleet = FleetAggregator()
+        self.location_filter_enabled: bool = config_entry.options.get(
+            CONF_LOCATION_FILTER, False
+        )
+        self.location_filters: dict[str, LocationFilter] = {}
 
     async def _async_update_data(self) -> CommaCoordinatorData:
         """Fetch data from API."""
@@ -76,9 +256,10 @@ class CommaDataUpdateCoordinator(DataUpdateCoordinator[CommaCoordinatorData]):
             # Convert devices list to dict keyed by dongle_id
             devices: dict[str, CommaDevice] = {}
             
-            # Fetch stats and location for each device
+            # Fetch stats, location and live telemetry for each device
             stats_tasks = {}
             location_tasks = {}
+            telemetry_tasks = {}
             async with asyncio.TaskGroup() as tg:
                 for device in devices_list:
                     dongle_id = device["dongle_id"]
@@ -88,11 +269,18 @@ class CommaDataUpdateCoordinator(DataUpdateCoordinator[CommaCoordinatorData]):
                     location_tasks[dongle_id] = tg.create_task(
                         self._get_device_location(dongle_id)
                     )
+                    telemetry_tasks[dongle_id] = tg.create_task(
+                        self._get_device_telemetry(
+                            dongle_id, device.get("last_athena_ping")
+                        )
+                    )
             
             for device in devices_list:
                 dongle_id = device["dongle_id"]
                 stats = stats_tasks[dongle_id].result()
                 location = location_tasks[dongle_id].result()
+                telemetry = telemetry_tasks[dongle_id].result()
+                lat, lng, accuracy = self._filter_location(dongle_id, location)
                 
                 devices[dongle_id] = CommaDevice(
                     dongle_id=dongle_id,
@@ -101,17 +289,24 @@ class CommaDataUpdateCoordinator(DataUpdateCoordinator[CommaCoordinatorData]):
                     is_owner=device.get("is_owner", False),
                     is_paired=device.get("is_paired", False),
                     prime=device.get("prime", False),
-                    location_lat=location.get("lat") if location else None,
-                    location_lng=location.get("lng") if location else None,
+                    location_lat=lat,
+                    location_lng=lng,
                     location_time=location.get("time") if location else None,
+                    location_accuracy=accuracy,
                     last_athena_ping=device.get("last_athena_ping"),
                     openpilot_version=device.get("openpilot_version"),
                     stats=stats,
+                    telemetry=telemetry,
                 )
 
+            # Drop filter state for devices no longer on the account
+            for dongle_id in self.location_filters.keys() - devices.keys():
+                del self.location_filters[dongle_id]
+
             return CommaCoordinatorData(
                 profile=profile,
                 devices=devices,
+                fleet=self.fleet.update(devices),
             )
 
         except CommaAPIError as err:
@@ -135,4 +330,34 @@ class CommaDataUpdateCoordinator(DataUpdateCoordinator[CommaCoordinatorData]):
             _LOGGER.debug("Could not fetch location for device %s", dongle_id)
             return None
 
+    def _filter_location(
+        self, dongle_id: str, location: dict[str, Any] | None
+    ) -> tuple[float | None, float | None, int]:
+        """Return the latitude, longitude and accuracy to publish for a device."""
+        if not location or location.get("lat") is None or location.get("lng") is None:
+            return None, None, 0
+
+        accuracy = location.get("accuracy")
+        if not self.location_filter_enabled:
+            return location["lat"], location["lng"], round(accuracy or 0)
+
+        location_filter = self.location_filters.setdefault(dongle_id, LocationFilter())
+        filtered = location_filter.update(
+            location["lat"], location["lng"], location.get("time"), accuracy
+        )
+        return filtered.lat, filtered.lng, filtered.accuracy
+
+    async def _get_device_telemetry(
+        self, dongle_id: str, last_athena_ping: int | None
+    ) -> CommaTelemetry | None:
+        """Get live device telemetry, return None if offline or not available."""
+        try:
+            results = await self.athena_client.get_telemetry(dongle_id, last_athena_ping)
+        except CommaAPIError:
+            _LOGGER.debug("Could not fetch telemetry for device %s", dongle_id)
+            return None
+        if results is None:
+            return None
+        return _parse_telemetry(results)
+
 
@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -60,6 +61,16 @@ class CommaDeviceTracker(CoordinatorEntity[CommaDataUpdateCoordinator], TrackerE
             model=device["device_type"],
             sw_version=device["openpilot_version"],
         )
+        self._last_written: tuple | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when the published location actually changed."""
+        current = (self.available, self.latitude, self.longitude, self.location_accuracy)
+        if current == self._last_written:
+            return
+        self._last_written = current
+        super()._handle_coordinator_update()
 
     @property
     def source_type(self) -> SourceType:
@@ -85,8 +96,10 @@ class CommaDeviceTracker(CoordinatorEntity[CommaDataUpdateCoordinator], TrackerE
     @property
     def location_accuracy(self) -> int:
         """Return the location accuracy of the device."""
-        # Location accuracy is not provided by the comma.ai location API
-        return 0
+        device = self.coordinator.data["devices"].get(self.dongle_id)
+        if device is None:
+            return 0
+        return device["location_accuracy"]
 
     @property
     def battery_level(self) -> int | None:
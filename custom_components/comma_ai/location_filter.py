@@ -0,0 +1,106 @@
+"""GPS jitter filtering for comma.ai device locations."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+# Accuracy assumed for a fix when the location API does not report one, in meters
+DEFAULT_FIX_ACCURACY = 10.0
+
+# How fast the true position is assumed to drift between fixes, in meters per second
+PROCESS_NOISE = 3.0
+
+# Fixes further than this many standard deviations from the estimate mean the
+# device has moved, so the filter restarts from the fix
+INNOVATION_GATE = 3.0
+
+EARTH_RADIUS = 6371000.0
+
+
+@dataclass
+class FilteredLocation:
+    """A smoothed location and its estimated accuracy in meters."""
+
+    lat: float
+    lng: float
+    accuracy: int
+
+
+def distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Return the great-circle distance between two points in meters."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+class LocationFilter:
+    """Constant-position Kalman filter with a publish hysteresis.
+
+    Each fix is blended into the estimate according to its accuracy and how
+    long it has been since the last fix. A fix too far from the estimate to be
+    noise means the device has moved, and the filter restarts from that fix so
+    it never trails the car. Otherwise the published location only moves once
+    the estimate has moved further than the combined uncertainty of the two,
+    so a parked device keeps reporting the same coordinates.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the filter."""
+        self._lat = 0.0
+        self._lng = 0.0
+        self._variance: float | None = None
+        self._time: int | None = None
+        self._published: FilteredLocation | None = None
+
+    def update(
+        self,
+        lat: float,
+        lng: float,
+        time: int | None,
+        accuracy: float | None = None,
+    ) -> FilteredLocation:
+        """Add a fix (time in milliseconds) and return the location to publish."""
+        if self._published is not None and time is not None and time == self._time:
+            return self._published
+
+        measurement_variance = (accuracy or DEFAULT_FIX_ACCURACY) ** 2
+        moved = self._variance is None
+        if not moved:
+            if time is not None and self._time is not None and time > self._time:
+                elapsed = (time - self._time) / 1000
+                self._variance += elapsed * PROCESS_NOISE**2
+            innovation = distance(self._lat, self._lng, lat, lng)
+            moved = innovation > INNOVATION_GATE * math.sqrt(
+                self._variance + measurement_variance
+            )
+
+        if moved:
+            self._lat, self._lng = lat, lng
+            self._variance = measurement_variance
+        else:
+            gain = self._variance / (self._variance + measurement_variance)
+            self._lat += gain * (lat - self._lat)
+            self._lng += gain * (lng - self._lng)
+            self._variance *= 1 - gain
+        self._time = time
+
+        estimate_accuracy = math.sqrt(self._variance)
+        if (
+            moved
+            or self._published is None
+            or distance(self._published.lat, self._published.lng, self._lat, self._lng)
+            > self._published.accuracy + estimate_accuracy
+        ):
+            self._published = FilteredLocation(
+                lat=self._lat,
+                lng=self._lng,
+                accuracy=math.ceil(estimate_accuracy),
+            )
+        return self._published
@@ -0,0 +1,211 @@
+"""On-demand profiling of the comma.ai refresh hot path."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import re
+import tracemalloc
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import CommaDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+INTEGRATION_DIR = os.path.dirname(__file__)
+
+# Functions called out separately in the summary. pstats matches this against
+# "file:line(function)", so it is limited to this integration's files and the
+# aiohttp request path to keep other integrations' entities out.
+HOT_PATH_PATTERN = (
+    f"{re.escape(INTEGRATION_DIR)}.*"
+    r"\((_async_update_data|_request|native_value|available)\)"
+    r"|aiohttp.*\(_request\)"
+)
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 20
+
+# Stack depth recorded per allocation, so allocations made in libraries on
+# behalf of this integration can be attributed to it
+TRACE_FRAMES = 25
+
+INTEGRATION_FILES = os.path.join(INTEGRATION_DIR, "*")
+
+
+def _take_snapshot() -> tracemalloc.Snapshot | None:
+    """Take an allocation snapshot limited to this integration's call stacks."""
+    try:
+        snapshot = tracemalloc.take_snapshot()
+    except RuntimeError:
+        # Tracing was stopped by someone else
+        return None
+    return snapshot.filter_traces(
+        (tracemalloc.Filter(True, INTEGRATION_FILES, all_frames=True),)
+    )
+
+
+class RefreshProfiler:
+    """Profile a number of refresh cycles of one or more coordinators.
+
+    A coordinator's refresh is only wrapped while a capture is running, so
+    nothing is added to the refresh path otherwise. Each profiled cycle covers
+    the API requests and the entity updates dispatched by the refresh.
+    Allocations are only traced while a refresh is running, and are reported
+    as the difference between snapshots taken before and after it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinators: list[CommaDataUpdateCoordinator],
+        cycles: int,
+    ) -> None:
+        """Initialize the profiler."""
+        self.hass = hass
+        self.cycles = cycles
+        self.completed = 0
+        self._remaining = {coordinator: cycles for coordinator in coordinators}
+        self._profile = cProfile.Profile()
+        self._profiling = 0
+        self._tracing = 0
+        self._owns_tracemalloc = False
+        self._allocations: list[tuple[tracemalloc.Snapshot, tracemalloc.Snapshot]] = []
+
+    @property
+    def active(self) -> bool:
+        """Return whether the capture is still running."""
+        return bool(self._remaining)
+
+    def start(self) -> None:
+        """Start wrapping the coordinator refreshes."""
+        for coordinator in self._remaining:
+            coordinator._async_refresh = partial(
+                self._profiled_refresh, coordinator, coordinator._async_refresh
+            )
+        _LOGGER.info("Profiling the next %s comma.ai refresh cycle(s)", self.cycles)
+
+    def remove(self, coordinator: CommaDataUpdateCoordinator) -> None:
+        """Stop profiling a coordinator, finishing the capture if it was the last."""
+        if self._remaining.pop(coordinator, None) is None:
+            return
+        vars(coordinator).pop("_async_refresh", None)
+        if not self._remaining and self.completed:
+            self.hass.async_create_task(self._async_write_results())
+
+    def cancel(self) -> None:
+        """Stop profiling every coordinator without writing results."""
+        for coordinator in self._remaining:
+            vars(coordinator).pop("_async_refresh", None)
+        self._remaining.clear()
+
+    def _start_tracing(self) -> None:
+        """Start allocation tracing for a refresh."""
+        if self._tracing == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._owns_tracemalloc = True
+        self._tracing += 1
+
+    def _stop_tracing(self) -> None:
+        """Stop allocation tracing once no refresh needs it."""
+        self._tracing -= 1
+        if self._tracing == 0 and self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def _enable_profile(self) -> None:
+        """Enable the profiler for a refresh."""
+        if self._profiling == 0:
+            self._profile.enable()
+        self._profiling += 1
+
+    def _disable_profile(self) -> None:
+        """Disable the profiler once no refresh needs it."""
+        self._profiling -= 1
+        if self._profiling == 0:
+            self._profile.disable()
+
+    async def _profiled_refresh(
+        self,
+        coordinator: CommaDataUpdateCoordinator,
+        refresh: Callable[..., Awaitable[None]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Run one refresh cycle under the profiler."""
+        self._start_tracing()
+        try:
+            before = await self.hass.async_add_executor_job(_take_snapshot)
+            try:
+                self._enable_profile()
+            except ValueError as err:
+                # Another profiler is already running on this thread
+                _LOGGER.warning("Could not start comma.ai profiling: %s", err)
+                self.cancel()
+                await refresh(*args, **kwargs)
+                return
+
+            try:
+                await refresh(*args, **kwargs)
+            finally:
+                self._disable_profile()
+            after = await self.hass.async_add_executor_job(_take_snapshot)
+            if before is not None and after is not None:
+                self._allocations.append((before, after))
+        finally:
+            self._stop_tracing()
+            if coordinator in self._remaining:
+                self.completed += 1
+                self._remaining[coordinator] -= 1
+                if self._remaining[coordinator] <= 0:
+                    self.remove(coordinator)
+
+    async def _async_write_results(self) -> None:
+        """Write the results to the config directory."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base_path = self.hass.config.path(f"{DOMAIN}_profile_{timestamp}")
+        await self.hass.async_add_executor_job(self._write_results, base_path)
+        _LOGGER.info("comma.ai profile written to %s.prof and %s.txt", base_path, base_path)
+
+    def _write_results(self, base_path: str) -> None:
+        """Write the stats dump and a readable summary."""
+        self._profile.dump_stats(f"{base_path}.prof")
+
+        stream = io.StringIO()
+        stream.write(f"comma.ai profile of {self.completed} refresh cycle(s)\n\n")
+
+        stats = pstats.Stats(self._profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        stream.write("Top functions by cumulative time\n")
+        stats.print_stats(TOP_FUNCTIONS)
+        stream.write("Refresh hot path\n")
+        stats.print_stats(HOT_PATH_PATTERN)
+
+        # Sum what each allocation site retained across the profiled cycles
+        sites: dict[str, list[int]] = {}
+        for before, after in self._allocations:
+            for diff in after.compare_to(before, "lineno"):
+                site = sites.setdefault(str(diff.traceback), [0, 0])
+                site[0] += diff.size_diff
+                site[1] += diff.count_diff
+
+        stream.write("Top allocation sites (retained during refresh)\n")
+        for site, (size, count) in sorted(
+            sites.items(), key=lambda item: item[1][0], reverse=True
+        )[:TOP_ALLOCATIONS]:
+            stream.write(f"{site}: size={size:+} B, count={count:+}\n")
+
+        with open(f"{base_path}.txt", "w", encoding="utf-8") as summary:
+            summary.write(stream.getvalue())
@@ -12,12 +12,18 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfLength, UnitOfTime
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfElectricPotential,
+    UnitOfLength,
+    UnitOfTime,
+)
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import CommaDataUpdateCoordinator, CommaDevice
+from .coordinator import CommaDataUpdateCoordinator, CommaDevice, CommaFleetStats
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -38,6 +44,13 @@ class CommaSensorEntityDescription(SensorEntityDescription, frozen_or_thawed=Tru
     extra_values_fn: Callable[[CommaDevice], dict[str, Any]] | None = None
 
 
+class CommaFleetSensorEntityDescription(SensorEntityDescription, frozen_or_thawed=True):
+    """Description for comma.ai account-wide Sensor Entity."""
+
+    value_fn: Callable[[CommaFleetStats], StateType]
+    extra_values_fn: Callable[[CommaFleetStats], dict[str, Any]] | None = None
+
+
 def get_last_ping_time(device: CommaDevice) -> StateType:
     """Get last ping time as datetime."""
     if device["last_athena_ping"] is None:
@@ -53,6 +66,41 @@ def get_last_location_time(device: CommaDevice) -> StateType:
     return datetime.fromtimestamp(device["location_time"] / 1000, tz=timezone.utc)
 
 
+def get_car_battery_voltage(device: CommaDevice) -> StateType:
+    """Get the car battery voltage."""
+    if device["telemetry"] is None:
+        return None
+    return device["telemetry"]["car_battery_voltage"]
+
+
+def get_thermal_status(device: CommaDevice) -> StateType:
+    """Get the device thermal status."""
+    if device["telemetry"] is None:
+        return None
+    return device["telemetry"]["thermal_status"]
+
+
+def get_network_type(device: CommaDevice) -> StateType:
+    """Get the current network type."""
+    if device["telemetry"] is None:
+        return None
+    return device["telemetry"]["network_type"]
+
+
+def get_network_metered(device: CommaDevice) -> StateType:
+    """Get whether the device is on a metered network."""
+    if device["telemetry"] is None or device["telemetry"]["network_metered"] is None:
+        return None
+    return "Yes" if device["telemetry"]["network_metered"] else "No"
+
+
+def get_onroad(device: CommaDevice) -> StateType:
+    """Get whether the device is currently onroad."""
+    if device["telemetry"] is None or device["telemetry"]["onroad"] is None:
+        return None
+    return "Yes" if device["telemetry"]["onroad"] else "No"
+
+
 SENSOR_DESCRIPTIONS: tuple[CommaSensorEntityDescription, ...] = (
     CommaSensorEntityDescription(
         key="device_type",
@@ -140,6 +188,106 @@ SENSOR_DESCRIPTIONS: tuple[CommaSensorEntityDescription, ...] = (
         state_class=SensorStateClass.TOTAL,
         value_fn=lambda device: device["stats"]["week"]["routes"] if device["stats"] else None,
     ),
+    # Live telemetry (only available while the device is online)
+    CommaSensorEntityDescription(
+        key="car_battery_voltage",
+        translation_key="car_battery_voltage",
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        suggested_display_precision=2,
+        icon="mdi:car-battery",
+        value_fn=get_car_battery_voltage,
+    ),
+    CommaSensorEntityDescription(
+        key="thermal_status",
+        translation_key="thermal_status",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:thermometer",
+        value_fn=get_thermal_status,
+    ),
+    CommaSensorEntityDescription(
+        key="network_type",
+        translation_key="network_type",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:wifi",
+        value_fn=get_network_type,
+    ),
+    CommaSensorEntityDescription(
+        key="network_metered",
+        translation_key="network_metered",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:cash",
+        value_fn=get_network_metered,
+    ),
+    CommaSensorEntityDescription(
+        key="onroad",
+        translation_key="onroad",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:steering",
+        value_fn=get_onroad,
+    ),
+)
+
+
+def get_most_recent_attributes(fleet: CommaFleetStats) -> dict[str, Any]:
+    """Get attributes of the most recently active device."""
+    last_ping = fleet["most_recent_ping"]
+    return {
+        "dongle_id": fleet["most_recent_dongle_id"],
+        "last_ping": (
+            datetime.fromtimestamp(last_ping, tz=timezone.utc).isoformat()
+            if last_ping is not None
+            else None
+        ),
+    }
+
+
+# Fleet totals drop when a device is removed from the account, so they use
+# TOTAL rather than TOTAL_INCREASING to avoid being read as a meter reset
+FLEET_SENSOR_DESCRIPTIONS: tuple[CommaFleetSensorEntityDescription, ...] = (
+    CommaFleetSensorEntityDescription(
+        key="fleet_distance",
+        translation_key="fleet_distance",
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        suggested_unit_of_measurement=UnitOfLength.MILES,
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=SensorStateClass.TOTAL,
+        suggested_display_precision=1,
+        icon="mdi:map-marker-distance",
+        value_fn=lambda fleet: fleet["total_distance"],
+    ),
+    CommaFleetSensorEntityDescription(
+        key="fleet_minutes",
+        translation_key="fleet_minutes",
+        native_unit_of_measurement=UnitOfTime.MINUTES,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.TOTAL,
+        icon="mdi:clock-outline",
+        value_fn=lambda fleet: fleet["total_minutes"],
+    ),
+    CommaFleetSensorEntityDescription(
+        key="fleet_routes",
+        translation_key="fleet_routes",
+        icon="mdi:road-variant",
+        state_class=SensorStateClass.TOTAL,
+        value_fn=lambda fleet: fleet["total_routes"],
+    ),
+    CommaFleetSensorEntityDescription(
+        key="devices_online",
+        translation_key="devices_online",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda fleet: fleet["devices_online"],
+    ),
+    CommaFleetSensorEntityDescription(
+        key="most_recent_device",
+        translation_key="most_recent_device",
+        icon="mdi:car-clock",
+        value_fn=lambda fleet: fleet["most_recent_device"],
+        extra_values_fn=get_most_recent_attributes,
+    ),
 )
 
 
@@ -156,6 +304,9 @@ async def async_setup_entry(
         for description in SENSOR_DESCRIPTIONS:
             entities.append(CommaDeviceSensor(coordinator, dongle_id, description))
 
+    for description in FLEET_SENSOR_DESCRIPTIONS:
+        entities.append(CommaFleetSensor(coordinator, description))
+
     async_add_entities(entities)
 
 
@@ -210,3 +361,42 @@ class CommaDeviceSensor(CoordinatorEntity[CommaDataUpdateCoordinator], SensorEnt
             and self.dongle_id in self.coordinator.data["devices"]
         )
 
+
+class CommaFleetSensor(CoordinatorEntity[CommaDataUpdateCoordinator], SensorEntity):
+    """Representation of a comma.ai account-wide sensor."""
+
+    entity_description: CommaFleetSensorEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: CommaDataUpdateCoordinator,
+        description: CommaFleetSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+
+        profile = coordinator.data["profile"]
+        account_id = str(profile["id"])
+        self._attr_unique_id = f"{account_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, account_id)},
+            name=profile.get("username") or profile.get("email") or "comma.ai account",
+            manufacturer="comma.ai",
+            model="Account",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.data["fleet"])
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return extra state attributes."""
+        if self.entity_description.extra_values_fn is None:
+            return None
+        return self.entity_description.extra_values_fn(self.coordinator.data["fleet"])
+
@@ -0,0 +1 @@
+"""Tests for the comma.ai integration."""
@@ -0,0 +1,64 @@
+"""Fixtures for comma.ai tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from aiohttp import web
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable loading the custom integration in every test."""
+
+
+class AthenaStandIn:
+    """Local stand-in for Athena that answers JSON-RPC batches for a device."""
+
+    def __init__(self) -> None:
+        """Initialize the stand-in."""
+        self.requests: list[list[dict[str, Any]]] = []
+        self.results: dict[str, Any] = {}
+        self.errors: dict[str, dict[str, Any]] = {}
+        self.status = 200
+        self.body: str | None = None
+        self.content_type = "application/json"
+        self.extra_responses: list[Any] = []
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        """Answer a JSON-RPC batch the way the device would."""
+        if self.body is not None:
+            return web.Response(
+                status=self.status, text=self.body, content_type=self.content_type
+            )
+        if self.status != 200:
+            return web.json_response({"error": "Device not connected"}, status=self.status)
+
+        batch = await request.json()
+        self.requests.append(batch)
+        responses = []
+        # Answer in reverse order to make sure responses are matched by id
+        for call in reversed(batch):
+            name = call["params"].get("service", call["method"])
+            if name in self.errors:
+                responses.append(
+                    {"jsonrpc": "2.0", "id": call["id"], "error": self.errors[name]}
+                )
+            else:
+                responses.append(
+                    {"jsonrpc": "2.0", "id": call["id"], "result": self.results.get(name)}
+                )
+        return web.json_response(self.extra_responses + responses)
+
+
+@pytest.fixture
+async def athena(
+    socket_enabled: None, aiohttp_server: Any
+) -> tuple[AthenaStandIn, str]:
+    """Run an Athena stand-in and return it with its base URL."""
+    stand_in = AthenaStandIn()
+    app = web.Application()
+    app.router.add_post("/{dongle_id}", stand_in.handle)
+    server = await aiohttp_server(app)
+    return stand_in, str(server.make_url("")).rstrip("/")
@@ -0,0 +1,204 @@
+"""Tests for the comma.ai Athena client."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from custom_components.comma_ai.api import (
+    AthenaCall,
+    CommaAPIError,
+    CommaAthenaClient,
+)
+from custom_components.comma_ai.const import (
+    ATHENA_CALL_TIMEOUT,
+    ATHENA_ONLINE_THRESHOLD,
+    ATHENA_RELAY_TIMEOUT,
+)
+
+from .conftest import AthenaStandIn
+
+DONGLE_ID = "0123456789abcdef"
+
+DEVICE_STATE = {
+    "deviceState": {"thermalStatus": "green", "networkType": "wifi", "started": False}
+}
+PERIPHERAL_STATE = {"peripheralState": {"voltage": 12450}}
+
+
+@pytest.fixture
+async def client(
+    athena: tuple[AthenaStandIn, str],
+) -> Any:
+    """Return an Athena client pointed at the stand-in."""
+    _, base_url = athena
+    async with aiohttp.ClientSession() as session:
+        yield CommaAthenaClient("token", session, base_url=base_url)
+
+
+def test_is_online() -> None:
+    """Devices are online only if they pinged Athena recently."""
+    now = time.time()
+    assert CommaAthenaClient.is_online(int(now) - 10, now)
+    assert not CommaAthenaClient.is_online(int(now) - ATHENA_ONLINE_THRESHOLD - 1, now)
+    assert not CommaAthenaClient.is_online(None, now)
+
+
+async def test_telemetry_batched(
+    athena: tuple[AthenaStandIn, str], client: CommaAthenaClient
+) -> None:
+    """All telemetry calls go out in one batch and are matched by id."""
+    stand_in, _ = athena
+    stand_in.results = {
+        "deviceState": DEVICE_STATE,
+        "peripheralState": PERIPHERAL_STATE,
+        "getNetworkMetered": True,
+    }
+
+    results = await client.get_telemetry(DONGLE_ID, int(time.time()))
+
+    assert results == {
+        "device_state": DEVICE_STATE,
+        "peripheral_state": PERIPHERAL_STATE,
+        "network_metered": True,
+    }
+    assert len(stand_in.requests) == 1
+    assert [call["method"] for call in stand_in.requests[0]] == [
+        "getMessage",
+        "getMessage",
+        "getNetworkMetered",
+    ]
+    assert all("timeout" in call["params"] for call in stand_in.requests[0][:2])
+
+
+async def test_offline_device_skipped(
+    athena: tuple[AthenaStandIn, str], client: CommaAthenaClient
+) -> None:
+    """Devices with a stale last_athena_ping are not contacted."""
+    stand_in, _ = athena
+
+    stale_ping = int(time.time()) - ATHENA_ONLINE_THRESHOLD - 60
+    assert await client.get_telemetry(DONGLE_ID, stale_ping) is None
+    assert await client.get_telemetry(DONGLE_ID, None) is None
+    assert stand_in.requests == []
+
+
+async def test_cache_hits_within_ttl(
+    athena: tuple[AthenaStandIn, str], client: CommaAthenaClient
+) -> None:
+    """Cached results are reused and only uncached calls are sent."""
+    stand_in, _ = athena
+    stand_in.results = {"deviceState": DEVICE_STATE, "getNetworkMetered": False}
+    calls = (
+        AthenaCall(key="device_state", method="getMessage", params={"service": "deviceState"}),
+        AthenaCall(key="network_metered", method="getNetworkMetered", ttl=300),
+    )
+
+    await client.call_batch(DONGLE_ID, calls)
+    stand_in.results["getNetworkMetered"] = True
+    results = await client.call_batch(DONGLE_ID, calls)
+
+    assert results["network_metered"] is False
+    assert len(stand_in.requests) == 2
+    assert [call["method"] for call in stand_in.requests[1]] == ["getMessage"]
+
+    await client.call_batch(DONGLE_ID, calls[1:])
+    assert len(stand_in.requests) == 2
+
+
+async def test_call_error_not_cached(
+    athena: tuple[AthenaStandIn, str], client: CommaAthenaClient
+) -> None:
+    """A failing call maps to None and is retried on the next batch."""
+    stand_in, _ = athena
+    stand_in.results = {"deviceState": DEVICE_STATE}
+    stand_in.errors = {"getNetworkMetered": {"code": -32000, "message": "failed"}}
+    calls = (
+        AthenaCall(key="device_state", method="getMessage", params={"service": "deviceState"}),
+        AthenaCall(key="network_metered", method="getNetworkMetered", ttl=300),
+    )
+
+    results = await client.call_batch(DONGLE_ID, calls)
+    assert results == {"device_state": DEVICE_STATE, "network_metered": None}
+
+    stand_in.errors = {}
+    stand_in.results["getNetworkMetered"] = True
+    results = await client.call_batch(DONGLE_ID, calls)
+    assert results["network_metered"] is True
+    assert len(stand_in.requests[1]) == 2
+
+
+async def test_malformed_elements_ignored(
+    athena: tuple[AthenaStandIn, str], client: CommaAthenaClient
+) -> None:
+    """Batch elements that are not responses to our calls are skipped."""
+    stand_in, _ = athena
+    stand_in.results = {
+        "deviceState": "not a message",
+        "peripheralState": PERIPHERAL_STATE,
+        "getNetworkMetered": True,
+    }
+    stand_in.extra_responses = [
+        "garbage",
+        None,
+        {"jsonrpc": "2.0", "id": [1], "result": 1},
+        {"jsonrpc": "2.0", "id": 999, "result": 1},
+        {"jsonrpc": "2.0", "result": 1},
+    ]
+
+    results = await client.get_telemetry(DONGLE_ID, int(time.time()))
+
+    assert results == {
+        "device_state": "not a message",
+        "peripheral_state": PERIPHERAL_STATE,
+        "network_metered": True,
+    }
+
+
+@pytest.mark.parametrize(
+    ("status", "body", "content_type"),
+    [
+        (404, None, "application/json"),
+        (500, None, "application/json"),
+        (200, "<html>bad gateway</html>", "text/html"),
+        (200, "{not json", "application/json"),
+        (200, '{"error": "batch rejected"}', "application/json"),
+        (200, "42", "application/json"),
+    ],
+)
+async def test_request_errors(
+    athena: tuple[AthenaStandIn, str],
+    client: CommaAthenaClient,
+    status: int,
+    body: str | None,
+    content_type: str,
+) -> None:
+    """HTTP errors and unusable bodies are raised as CommaAPIError."""
+    stand_in, _ = athena
+    stand_in.status = status
+    stand_in.body = body
+    stand_in.content_type = content_type
+
+    with pytest.raises(CommaAPIError):
+        await client.get_telemetry(DONGLE_ID, int(time.time()))
+
+
+async def test_batch_timeout_covers_every_call(
+    athena: tuple[AthenaStandIn, str], client: CommaAthenaClient
+) -> None:
+    """The round-trip timeout allows each call in the batch its full timeout."""
+    calls = (
+        AthenaCall(key="a", method="getMessage", params={"timeout": 1500}),
+        AthenaCall(key="b", method="getMessage", params={"timeout": 1500}),
+        AthenaCall(key="c", method="getNetworkMetered"),
+    )
+
+    with patch.object(client, "_request", AsyncMock(return_value=[])) as mock_request:
+        await client.call_batch(DONGLE_ID, calls)
+
+    expected = (1500 + 1500 + ATHENA_CALL_TIMEOUT) / 1000 + ATHENA_RELAY_TIMEOUT
+    assert mock_request.call_args.kwargs["timeout"] == expected
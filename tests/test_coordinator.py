@@ -0,0 +1,136 @@
+"""Tests for the comma.ai coordinator helpers."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+
+from custom_components.comma_ai.coordinator import (
+    CommaDevice,
+    CommaTelemetry,
+    FleetAggregator,
+    _parse_telemetry,
+)
+
+
+def make_device(
+    dongle_id: str,
+    distance: float | None,
+    last_athena_ping: int | None,
+) -> CommaDevice:
+    """Build a device with only the fields the aggregator reads."""
+    stats: dict[str, Any] | None = None
+    if distance is not None:
+        stats = {"all": {"distance": distance, "minutes": 10, "routes": 2}}
+    return CommaDevice(
+        dongle_id=dongle_id,
+        alias=dongle_id.upper(),
+        device_type="three",
+        is_owner=True,
+        is_paired=True,
+        prime=False,
+        location_lat=None,
+        location_lng=None,
+        location_time=None,
+        location_accuracy=0,
+        last_athena_ping=last_athena_ping,
+        openpilot_version=None,
+        stats=stats,
+        telemetry=None,
+    )
+
+
+def test_fleet_totals_follow_device_changes() -> None:
+    """Totals track changed, removed and added devices."""
+    now = int(time.time())
+    fleet = FleetAggregator()
+
+    stats = fleet.update(
+        {"a": make_device("a", 1.5, now), "b": make_device("b", 2.0, now - 3600)}
+    )
+    assert stats["total_distance"] == 3.5
+    assert stats["total_minutes"] == 20
+    assert stats["total_routes"] == 4
+    assert stats["devices_online"] == 1
+    assert stats["most_recent_device"] == "A"
+
+    stats = fleet.update(
+        {"a": make_device("a", 1.5, now), "b": make_device("b", 3.0, now + 5)}
+    )
+    assert stats["total_distance"] == 4.5
+    assert stats["devices_online"] == 2
+    assert stats["most_recent_device"] == "B"
+
+    stats = fleet.update({"a": make_device("a", 1.5, now)})
+    assert stats["total_distance"] == 1.5
+    assert stats["most_recent_device"] == "A"
+
+
+def test_missing_stats_keep_previous_contribution() -> None:
+    """A failed stats fetch does not drop the device from the totals."""
+    now = int(time.time())
+    fleet = FleetAggregator()
+    fleet.update({"a": make_device("a", 1.5, now), "b": make_device("b", 2.0, now)})
+
+    stats = fleet.update(
+        {"a": make_device("a", None, now), "b": make_device("b", 2.0, now)}
+    )
+    assert stats["total_distance"] == 3.5
+    assert stats["total_routes"] == 4
+
+    stats = fleet.update(
+        {"a": make_device("a", 1.5, now), "b": make_device("b", 2.0, now)}
+    )
+    assert stats["total_distance"] == 3.5
+
+
+def test_parse_telemetry() -> None:
+    """Athena results are mapped to telemetry fields."""
+    telemetry = _parse_telemetry(
+        {
+            "device_state": {
+                "deviceState": {
+                    "thermalStatus": "green",
+                    "networkType": "wifi",
+                    "started": True,
+                }
+            },
+            "peripheral_state": {"peripheralState": {"voltage": 12450}},
+            "network_metered": False,
+        }
+    )
+
+    assert telemetry == CommaTelemetry(
+        car_battery_voltage=12.45,
+        thermal_status="green",
+        network_type="wifi",
+        network_metered=False,
+        onroad=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "results",
+    [
+        {"device_state": "oops", "peripheral_state": [1], "network_metered": "yes"},
+        {"device_state": {"deviceState": "oops"}, "peripheral_state": {"peripheralState": 5}},
+        {
+            "device_state": {
+                "deviceState": {"thermalStatus": 1, "networkType": {}, "started": "no"}
+            },
+            "peripheral_state": {"peripheralState": {"voltage": "12v"}},
+        },
+        {"device_state": None, "peripheral_state": None, "network_metered": None},
+    ],
+)
+def test_parse_malformed_telemetry(results: dict[str, Any]) -> None:
+    """Malformed Athena results map to None instead of raising."""
+    assert _parse_telemetry(results) == CommaTelemetry(
+        car_battery_voltage=None,
+        thermal_status=None,
+        network_type=None,
+        network_metered=None,
+        onroad=None,
+    )
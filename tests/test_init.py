@@ -0,0 +1,59 @@
+"""Tests for comma.ai setup."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.comma_ai.const import CONF_JWT_TOKEN, CONF_LOCATION_FILTER, DOMAIN
+
+
+@pytest.fixture
+def mock_api() -> Generator[None]:
+    """Patch the comma.ai API with an account that has no devices."""
+    with (
+        patch(
+            "custom_components.comma_ai.api.CommaAPIClient.get_profile",
+            AsyncMock(return_value={"id": "abc123", "username": "tester"}),
+        ),
+        patch(
+            "custom_components.comma_ai.api.CommaAPIClient.get_devices",
+            AsyncMock(return_value=[]),
+        ),
+    ):
+        yield
+
+
+async def test_reload_only_on_option_change(hass: HomeAssistant, mock_api: None) -> None:
+    """Data updates do not trigger a second reload, option changes do."""
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_JWT_TOKEN: "token"})
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+
+    with patch.object(hass.config_entries, "async_reload") as mock_reload:
+        hass.config_entries.async_update_entry(entry, data={CONF_JWT_TOKEN: "new"})
+        await hass.async_block_till_done()
+        mock_reload.assert_not_called()
+
+        hass.config_entries.async_update_entry(
+            entry, options={CONF_LOCATION_FILTER: True}
+        )
+        await hass.async_block_till_done()
+        mock_reload.assert_called_once_with(entry.entry_id)
+
+
+async def test_profile_without_entries(hass: HomeAssistant) -> None:
+    """The profile service rejects calls when no entries are loaded."""
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, "profile", {"cycles": 1}, blocking=True)
@@ -0,0 +1,58 @@
+"""Tests for the comma.ai GPS jitter filter."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from custom_components.comma_ai.location_filter import LocationFilter, distance
+
+MINUTE = 60000
+
+
+@pytest.mark.parametrize("speed", [30.0, 10.0])
+def test_drive_then_park_publishes_last_fix(speed: float) -> None:
+    """After driving and parking, the published location is the parked fix."""
+    location_filter = LocationFilter()
+    # About 111 km per degree of latitude
+    step = speed * 60 / 111_000
+
+    for i in range(15):
+        published = location_filter.update(40 + i * step, -75.0, i * MINUTE)
+    parked = (40 + 14 * step, -75.0)
+
+    # The location API keeps returning the same fix once the car is parked
+    for _ in range(5):
+        published = location_filter.update(*parked, 14 * MINUTE)
+
+    assert (published.lat, published.lng) == parked
+    assert published.accuracy == 10
+
+
+def test_parked_jitter_is_suppressed() -> None:
+    """Small drift around a parked position does not move the published fix."""
+    rng = random.Random(1)
+    location_filter = LocationFilter()
+    published = set()
+
+    for i in range(60):
+        fix = location_filter.update(
+            40 + rng.gauss(0, 0.00004), -75 + rng.gauss(0, 0.00004), i * MINUTE
+        )
+        published.add((fix.lat, fix.lng))
+
+    assert len(published) == 1
+    lat, lng = published.pop()
+    assert distance(lat, lng, 40, -75) < 20
+
+
+def test_move_after_parking_is_published() -> None:
+    """Leaving a parking spot publishes the new fix straight away."""
+    location_filter = LocationFilter()
+    for i in range(10):
+        location_filter.update(40.0, -75.0, i * MINUTE)
+
+    published = location_filter.update(40.01, -75.0, 10 * MINUTE)
+
+    assert (published.lat, published.lng) == (40.01, -75.0)
@@ -0,0 +1,133 @@
+"""Tests for the comma.ai refresh profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import tracemalloc
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.comma_ai.api import CommaAPIClient
+from custom_components.comma_ai.profiler import INTEGRATION_DIR, RefreshProfiler
+
+
+class ForeignEntity:
+    """Entity from another integration updated while a refresh runs."""
+
+    @property
+    def native_value(self) -> int:
+        """Return a value."""
+        return 1
+
+    @property
+    def available(self) -> bool:
+        """Return availability."""
+        return True
+
+
+class FakeCoordinator:
+    """Coordinator stand-in whose refresh allocates and yields."""
+
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize the coordinator."""
+        self.fail = fail
+        self.refreshes = 0
+        self.kept: list[Any] = []
+        response = MagicMock(status=200, json=AsyncMock(return_value={}))
+        self.api_client = CommaAPIClient(
+            "token", MagicMock(request=AsyncMock(return_value=response))
+        )
+
+    async def _async_refresh(self, **kwargs: Any) -> None:
+        """Pretend to refresh."""
+        self.refreshes += 1
+        self.kept.append([str(i) for i in range(1000)])
+        await self.api_client.get_profile()
+        entity = ForeignEntity()
+        assert entity.native_value and entity.available
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("refresh failed")
+
+
+@pytest.fixture(autouse=True)
+def config_dir(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Write profiles to a per-test config directory."""
+    hass.config.config_dir = str(tmp_path)
+
+
+def profile_files(hass: HomeAssistant) -> list[Path]:
+    """Return the profile files written to the config directory."""
+    return sorted(Path(hass.config.config_dir).glob("comma_ai_profile_*"))
+
+
+async def test_capture_across_coordinators(hass: HomeAssistant) -> None:
+    """One capture profiles each coordinator for its cycles and writes once."""
+    first = FakeCoordinator()
+    second = FakeCoordinator()
+    profiler = RefreshProfiler(hass, [first, second], 2)
+    profiler.start()
+
+    await asyncio.gather(first._async_refresh(), second._async_refresh())
+    await first._async_refresh()
+    # The first coordinator finishing must not disturb the second
+    assert "_async_refresh" not in vars(first)
+    assert profiler.active
+    await second._async_refresh()
+    await hass.async_block_till_done()
+
+    assert not profiler.active
+    assert "_async_refresh" not in vars(second)
+    assert not tracemalloc.is_tracing()
+    assert profiler.completed == 4
+
+    prof, summary = profile_files(hass)
+    assert prof.suffix == ".prof"
+    text = summary.read_text()
+    assert "profile of 4 refresh cycle(s)" in text
+    assert "Top allocation sites" in text
+    assert "test_profiler.py" in text.split("Top allocation sites")[1]
+
+    # Only this integration's functions belong in the hot path section
+    hot_path = text.split("Refresh hot path")[1].split("Top allocation sites")[0]
+    rows = re.findall(r"^\s*\d+.*:\d+\(\w+\)$", hot_path, re.MULTILINE)
+    assert any(row.endswith("(_request)") for row in rows)
+    assert all(INTEGRATION_DIR in row or "aiohttp" in row for row in rows)
+    assert "test_profiler.py" not in hot_path
+
+
+async def test_failing_refresh_still_unwraps(hass: HomeAssistant) -> None:
+    """A refresh that raises still counts and restores the coordinator."""
+    coordinator = FakeCoordinator(fail=True)
+    profiler = RefreshProfiler(hass, [coordinator], 1)
+    profiler.start()
+
+    try:
+        await coordinator._async_refresh()
+    except RuntimeError:
+        pass
+    await hass.async_block_till_done()
+
+    assert not profiler.active
+    assert "_async_refresh" not in vars(coordinator)
+    assert not tracemalloc.is_tracing()
+    assert len(profile_files(hass)) == 2
+
+
+async def test_remove_before_any_cycle(hass: HomeAssistant) -> None:
+    """Removing every coordinator before a cycle runs writes nothing."""
+    coordinator = FakeCoordinator()
+    profiler = RefreshProfiler(hass, [coordinator], 3)
+    profiler.start()
+
+    profiler.remove(coordinator)
+    await hass.async_block_till_done()
+
+    assert not profiler.active
+    assert "_async_refresh" not in vars(coordinator)
+    assert profile_files(hass) == []